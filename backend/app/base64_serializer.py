@@ -22,30 +22,52 @@ The serializer is designed to work with the Pipecat audio processing pipeline an
 - Serialization of outgoing audio frames to base64
 - Deserialization of incoming base64 data to audio frames
 - Audio resampling when input/output sample rates differ
+- Optional batching of outgoing audio frames into a single WebSocket message
 - Special handling for interruption events
+
+An optional binary mode skips base64 and JSON altogether: each WebSocket message
+is a one byte tag followed by raw 16-bit PCM (see BINARY_MEDIA / BINARY_STOP).
 """
 
-from typing import Optional
+import asyncio
+from typing import Awaitable, Callable, Optional
 from pydantic import BaseModel
-import base64
 import json
+import numpy as np
 from loguru import logger
 
+# pybase64 dispatches to SIMD (AVX2/SSE4.1/NEON) codecs at runtime and is
+# several times faster than the stdlib for audio-sized buffers.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from pipecat.frames.frames import (
     AudioRawFrame,
+    CancelFrame,
+    EndFrame,
     Frame,
     InputAudioRawFrame,
     StartInterruptionFrame,
     StartFrame,
 )
 from pipecat.serializers.base_serializer import FrameSerializer, FrameSerializerType
-from pipecat.audio.utils import create_stream_resampler
+
+from resamplers import SoxrStreamResampler
+
+# Message tags used in binary mode
+BINARY_STOP = b'\x00'
+BINARY_MEDIA = b'\x01'
+
+logger = logger.bind(component="b64serializer")
 
 class Base64AudioSerializer(FrameSerializer):
     """Serializer for base64-encoded audio data over WebSocket.
     
     Handles conversion between raw PCM audio data and base64-encoded format,
-    with optional resampling support.
+    with optional resampling support. In binary mode raw PCM is exchanged
+    instead, prefixed with a one byte message tag.
     """
 
     class InputParams(BaseModel):
@@ -54,35 +76,67 @@ class Base64AudioSerializer(FrameSerializer):
         Parameters:
             target_sample_rate: Target sample rate for audio processing
             sample_rate: Optional override for pipeline input sample rate
+            batch_size: Maximum number of audio frames per outgoing message (1 disables batching)
+            batch_interval: Maximum time in seconds an audio frame may wait in a batch. By
+                default derived from the frame duration: the output transport sends frames
+                in real time, so a batch fills (batch_size - 1) frame durations after its
+                first frame, and the timer fires half a frame later, only for a partial
+                batch. That wait is the latency cost of batching, paid by the first frame
+                of each batch (one frame duration with batch_size=2).
+            binary: Exchange tagged raw PCM binary messages instead of JSON + base64
+            resampler_quality: soxr quality preset used when sample rates differ
         """
         target_sample_rate: int = 16000
         sample_rate: Optional[int] = None
+        batch_size: int = 1
+        batch_interval: Optional[float] = None
+        binary: bool = False
+        resampler_quality: str = "QQ"
+
+    # Pre-serialized JSON messages. base64 output never needs JSON escaping, so
+    # media messages are assembled around the encoder's bytes rather than going
+    # through json.dumps, and decoded to str only once.
+    _STOP_MSG = json.dumps({"event": "stop"})
+    _MEDIA_PREFIX = b'{"event":"media","data":"'
+    _MEDIA_SUFFIX = b'"}'
+    _BATCH_PREFIX = b'{"event":"batch","items":['
+    _BATCH_SUFFIX = b']}'
 
     def __init__(
         self,
         params: Optional[InputParams] = None,
+        send_callback: Optional[Callable[[str | bytes], Awaitable[None]]] = None,
     ):
         """Initialize the Base64AudioSerializer.
 
         Args:
-            params: Configuration parameters for sample rates and resampling
+            params: Configuration parameters for sample rates, resampling and batching
+            send_callback: Optional coroutine used to flush a partial batch once
+                batch_interval expires. Without it, a partial batch is only flushed
+                by the next serialized audio frame.
         """
         self._params = params or Base64AudioSerializer.InputParams()
         self._target_sample_rate = self._params.target_sample_rate
         self._sample_rate = 0  # Pipeline input rate
+        self._needs_resample = True  # Resolved in setup() once the pipeline rate is known
 
         # Initialize resamplers for input and output
-        self._input_resampler = create_stream_resampler()
-        self._output_resampler = create_stream_resampler()
+        self._input_resampler = SoxrStreamResampler(self._params.resampler_quality)
+        self._output_resampler = SoxrStreamResampler(self._params.resampler_quality)
+
+        # Outgoing audio batching state
+        self._send_callback = send_callback
+        self._pending = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     @property
     def type(self) -> FrameSerializerType:
         """Gets the serializer type.
 
         Returns:
-            The serializer type (TEXT for base64-encoded data)
+            The serializer type (TEXT for base64-encoded data, BINARY in binary mode)
         """
-        return FrameSerializerType.TEXT
+        return FrameSerializerType.BINARY if self._params.binary else FrameSerializerType.TEXT
 
     async def setup(self, frame: StartFrame):
         """Sets up the serializer with pipeline configuration.
@@ -91,6 +145,7 @@ class Base64AudioSerializer(FrameSerializer):
             frame: The StartFrame containing pipeline configuration including sample rates
         """
         self._sample_rate = self._params.sample_rate or frame.audio_in_sample_rate
+        self._needs_resample = self._target_sample_rate != self._sample_rate
 
     async def serialize(self, frame: Frame) -> str | bytes | None:
         """Serializes a Pipecat frame to base64-encoded format.
@@ -99,17 +154,30 @@ class Base64AudioSerializer(FrameSerializer):
             frame: The Pipecat frame to serialize (AudioRawFrame or StartInterruptionFrame)
 
         Returns:
-            JSON string containing base64-encoded audio data or control events,
-            or None if frame type is not handled
+            JSON string containing base64-encoded audio data or control events
+            (bytes in binary mode), or None if frame type is not handled
 
         The serialized format is a JSON object with:
         - For audio: {"event": "media", "data": "<base64-encoded-audio>"}
+        - For batched audio: {"event": "batch", "items": [<media>, ...]}
         - For interruption: {"event": "stop"}
+
+        In binary mode:
+        - For audio: BINARY_MEDIA + <pcm> (batched frames are concatenated)
+        - For interruption: BINARY_STOP
         """
         try:
             if isinstance(frame, StartInterruptionFrame):
-                response = {"event": "stop"}
-                return json.dumps(response)
+                # Queued audio is stale once the user barges in, drop it
+                self._cancel_flush()
+                self._pending.clear()
+                if self._params.binary:
+                    return BINARY_STOP
+                return self._STOP_MSG
+
+            elif isinstance(frame, (EndFrame, CancelFrame)):
+                self._cancel_flush()
+                return self._take_batch() if isinstance(frame, EndFrame) else None
 
             elif isinstance(frame, AudioRawFrame):
                 # Resample if needed
@@ -122,64 +190,150 @@ class Base64AudioSerializer(FrameSerializer):
                 else:
                     resampled_data = frame.audio
 
-                # Encode to base64
-                encoded_data = base64.b64encode(resampled_data).decode('utf-8')
+                if self._params.batch_size <= 1:
+                    return self._encode_audio([resampled_data])
 
-                response = {"event": "media", "data": encoded_data}
-                return json.dumps(response)
+                self._pending.append(resampled_data)
+                # Flush when the batch is full, or when the interval already
+                # expired without a send_callback to flush it
+                expired = self._flush_task is None and len(self._pending) > 1
+                if expired or len(self._pending) >= self._params.batch_size:
+                    self._cancel_flush()
+                    return self._take_batch()
+
+                if self._flush_task is None:
+                    self._flush_task = asyncio.create_task(
+                        self._flush_after_interval(self._batch_interval(resampled_data))
+                    )
+                return None
 
             else:
-                print('Unhandled frame: ', frame)
+                logger.opt(lazy=True).debug("Unhandled frame: {f}", f=lambda: repr(frame))
                 return None
 
-        except Exception as e:
-            logger.error(f"Error serializing audio frame: {e}")
+        except Exception:
+            logger.opt(exception=True).error("Error serializing audio frame")
+            return None
+
+    def _encode_audio(self, chunks: list[bytes]) -> str | bytes:
+        """Encodes one or more PCM chunks into a single outgoing message.
+
+        Args:
+            chunks: Raw PCM audio chunks, in playback order
+
+        Returns:
+            A media message for a single chunk or a batch message for several,
+            or a tagged binary message in binary mode
+        """
+        if self._params.binary:
+            return BINARY_MEDIA + b''.join(chunks)
+
+        assert all(isinstance(chunk, bytes) for chunk in chunks), "audio chunks must be bytes"
+
+        items = [
+            b''.join((self._MEDIA_PREFIX, base64.b64encode(chunk), self._MEDIA_SUFFIX))
+            for chunk in chunks
+        ]
+        if len(items) == 1:
+            return items[0].decode('ascii')
+        return b''.join((self._BATCH_PREFIX, b','.join(items), self._BATCH_SUFFIX)).decode('ascii')
+
+    def _take_batch(self) -> str | bytes | None:
+        """Drains pending audio into a single serialized message.
+
+        Returns:
+            The encoded message, or None if nothing is pending
+        """
+        if not self._pending:
             return None
 
+        chunks, self._pending = self._pending, []
+        return self._encode_audio(chunks)
+
+    def _cancel_flush(self):
+        """Cancels the pending batch flush timer, if any."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    def _batch_interval(self, chunk: bytes) -> float:
+        """Gets how long the first frame of a batch may wait for the rest.
+
+        Args:
+            chunk: The first PCM chunk of the batch, at the target sample rate
+
+        Returns:
+            batch_interval if set, otherwise the time the output transport takes to
+            send the remaining batch_size - 1 frames of this duration, plus half a
+            frame so that a full batch is sent inline rather than by the timer
+        """
+        if self._params.batch_interval is not None:
+            return self._params.batch_interval
+        frame_secs = len(chunk) / (2 * self._target_sample_rate)
+        return (self._params.batch_size - 0.5) * frame_secs
+
+    async def _flush_after_interval(self, interval: float):
+        """Flushes a partial batch once it has waited interval seconds.
+
+        Args:
+            interval: Time in seconds to wait, see _batch_interval
+        """
+        try:
+            await asyncio.sleep(interval)
+            self._flush_task = None
+            if self._send_callback:
+                message = self._take_batch()
+                if message:
+                    await self._send_callback(message)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.opt(exception=True).error("Error flushing audio batch")
+
     async def deserialize(self, data: str | bytes) -> Frame | None:
         """Deserializes base64-encoded data to Pipecat frames.
 
         Args:
-            data: The base64-encoded audio data as string or bytes
+            data: The base64-encoded audio data as string or bytes, or a
+                BINARY_MEDIA tagged PCM message in binary mode
 
         Returns:
             An InputAudioRawFrame containing the decoded and resampled audio data,
             or None if deserialization fails
 
         Process:
-        1. Decode base64 data to bytes
-        2. Convert to numpy array (16-bit PCM format)
-        3. Resample if needed
-        4. Create InputAudioRawFrame with processed audio
+        1. Decode base64 data to bytes (or strip the tag in binary mode)
+        2. If the client and pipeline rates differ, view as 16-bit PCM and resample
+        3. Create InputAudioRawFrame with processed audio
         """
         try:
-            # Decode base64 data
-            if isinstance(data, bytes):
-                data = data.decode('utf-8')
-            
-            decoded_data = base64.b64decode(data)
-            
-            # Convert to numpy array (assuming 16-bit PCM)
-            import numpy as np
-            audio_data = np.frombuffer(decoded_data, dtype=np.int16)
-
-            # Resample if needed
-            if self._target_sample_rate != self._sample_rate:
-                audio_data = await self._input_resampler.resample(
+            if self._params.binary:
+                # Dispatch on the message tag
+                if data[:1] != BINARY_MEDIA:
+                    return None
+                decoded_data = data[1:]
+            else:
+                # Decode base64 data (str and bytes are both accepted directly)
+                decoded_data = base64.b64decode(data, validate=False)
+
+            # Resample if needed; otherwise pass the decoded PCM straight through
+            if self._needs_resample:
+                # View as numpy array (assuming 16-bit PCM), no copy
+                audio_data = np.frombuffer(decoded_data, dtype=np.int16)
+                final_bytes = await self._input_resampler.resample(
                     audio_data,
                     self._target_sample_rate,
                     self._sample_rate
                 )
-
-            # Convert back to bytes
-            decoded_data = audio_data.tobytes()
+            else:
+                final_bytes = decoded_data
 
             return InputAudioRawFrame(
-                audio=decoded_data,
+                audio=final_bytes,
                 num_channels=1,
                 sample_rate=self._sample_rate
             )
 
-        except Exception as e:
-            logger.error(f"Error deserializing audio data: {e}")
+        except Exception:
+            logger.opt(exception=True).error("Error deserializing audio data")
             return None
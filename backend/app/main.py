@@ -36,6 +36,8 @@ Environment Variables:
 - AWS_ACCESS_KEY_ID: AWS access key
 - AWS_SECRET_ACCESS_KEY: AWS secret key
 - AWS_SESSION_TOKEN: AWS session token
+- BINARY_AUDIO: Set to "true" to exchange tagged raw PCM binary messages instead of
+  JSON + base64 (clients must use the same format)
 """
 
 import asyncio
@@ -44,13 +46,20 @@ import base64
 import traceback
 import boto3
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import httpx
 from fastapi import FastAPI, WebSocket, Request, Response
+from starlette.websockets import WebSocketState
 import uvicorn
 
+# uvloop is a faster libuv-based drop-in for the default asyncio event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
 from pipecat.audio.vad.silero import SileroVADAnalyzer, VADParams
@@ -70,51 +79,73 @@ from pipecat.processors.transcript_processor import TranscriptProcessor
 from base64_serializer import Base64AudioSerializer
 
 SAMPLE_RATE = 16000
+# Max outgoing audio frames coalesced into one WebSocket message. Frames are sent in
+# real time, so the first frame of a batch waits (AUDIO_BATCH_SIZE - 1) frame durations.
+AUDIO_BATCH_SIZE = 2
+BINARY_AUDIO = os.getenv("BINARY_AUDIO", "false").lower() == "true"
 API_KEY = "Your-own-long-secret-text-to-access-the-api"
 
-def update_dredentials():
+# Shared client for the ECS container credentials endpoint
+_METADATA_CLIENT = httpx.AsyncClient(base_url="http://169.254.170.2", timeout=2.0)
+# Credentials are refetched once they are this close to expiring
+CREDENTIALS_REFRESH_WINDOW = timedelta(minutes=5)
+_credentials_expiration = None
+
+async def update_credentials():
     """
     Updates AWS credentials by fetching from ECS container metadata endpoint.
     Used in containerized environments to maintain fresh credentials.
+    The fetched credentials are reused until they are within
+    CREDENTIALS_REFRESH_WINDOW of their expiration.
     """
+    global _credentials_expiration
     try:
         uri = os.environ.get("AWS_CONTAINER_CREDENTIALS_RELATIVE_URI")
         if uri:
+            if _credentials_expiration and datetime.now(timezone.utc) < _credentials_expiration - CREDENTIALS_REFRESH_WINDOW:
+                return
+
             print("Fetching fresh AWS credentials for Bedrock client", flush=True)
-            with httpx.Client() as client:
-                response = client.get(f"http://169.254.170.2{uri}")
-                if response.status_code == 200:
-                    creds = response.json()
-                    os.environ["AWS_ACCESS_KEY_ID"] = creds["AccessKeyId"]
-                    os.environ["AWS_SECRET_ACCESS_KEY"] = creds["SecretAccessKey"]
-                    os.environ["AWS_SESSION_TOKEN"] = creds["Token"]
-                    print("AWS credentials refreshed successfully", flush=True)
-                else:
-                    print(f"Failed to fetch fresh credentials: {response.status_code}", flush=True)
+            response = await _METADATA_CLIENT.get(uri)
+            if response.status_code == 200:
+                creds = response.json()
+                os.environ["AWS_ACCESS_KEY_ID"] = creds["AccessKeyId"]
+                os.environ["AWS_SECRET_ACCESS_KEY"] = creds["SecretAccessKey"]
+                os.environ["AWS_SESSION_TOKEN"] = creds["Token"]
+                if creds.get("Expiration"):
+                    _credentials_expiration = datetime.fromisoformat(creds["Expiration"].replace("Z", "+00:00"))
+                print("AWS credentials refreshed successfully", flush=True)
+            else:
+                print(f"Failed to fetch fresh credentials: {response.status_code}", flush=True)
     except Exception as e:
         print(f"Error refreshing credentials: {str(e)}", flush=True)
 
+# Accepted passcodes for the demo account, compared case-insensitively
+_VALID_PASSCODES = frozenset({"nova sonic is awesome", "novasonic is awesome"})
+
 async def get_balance_from_api(params: FunctionCallParams):
-    if params.arguments["username"] == 'suresh':
-        if params.arguments["secret_passcode"].lower() != 'nova sonic is awesome' or params.arguments["secret_passcode"].lower() != 'novasonic is awesome':
-            await params.result_callback(
-                {
-                    "balance": 5000 if params.arguments["account_type"] == 'savings' else 14000
-                }
-            )
-
-        else:
-            print('INCORRECT PASSCODE !')
-            await params.result_callback(
-                {
-                    "message": "Incorrect passcode."
-                }
-            )
+    arguments = params.arguments
+    if arguments["username"] != 'suresh':
+        await params.result_callback(
+            {
+                "message": "No such user found."
+            }
+        )
+        return
+
+    passcode = arguments.get("secret_passcode", "").lower()
+    if passcode in _VALID_PASSCODES:
+        await params.result_callback(
+            {
+                "balance": 5000 if arguments["account_type"] == 'savings' else 14000
+            }
+        )
 
     else:
+        print('INCORRECT PASSCODE !')
         await params.result_callback(
             {
-                "message": "No such user found."
+                "message": "Incorrect passcode."
             }
         )
 
@@ -141,6 +172,16 @@ weather_function = FunctionSchema(
 # Create tools schema
 tools = ToolsSchema(standard_tools=[weather_function])
 
+# System prompt is static, read it once rather than on every connection
+_SYSTEM_INSTRUCTION = Path(__file__).parent.joinpath('prompt.txt').read_text() + f"\n{AWSNovaSonicLLMService.AWAIT_TRIGGER_ASSISTANT_RESPONSE_INSTRUCTION}"
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_INSTRUCTION}
+
+# AWS Nova Sonic parameters, only read by the service so shared across connections
+_BASE_PARAMS = Params(
+    input_sample_rate=SAMPLE_RATE,
+    output_sample_rate=SAMPLE_RATE
+)
+
 async def setup(websocket: WebSocket):
     """
     Sets up the audio processing pipeline and WebSocket connection.
@@ -154,13 +195,30 @@ async def setup(websocket: WebSocket):
     - Context management
     - Event handlers for client connection/disconnection
     """
-    update_dredentials()
-    
-    system_instruction = Path('prompt.txt').read_text() + f"\n{AWSNovaSonicLLMService.AWAIT_TRIGGER_ASSISTANT_RESPONSE_INSTRUCTION}"
+    await update_credentials()
+
+    send = websocket.send_bytes if BINARY_AUDIO else websocket.send_text
+
+    async def send_audio_batch(message):
+        """Sends an audio batch flushed by the serializer's timer.
+
+        The flush does not go through the transport, so like the transport's
+        client it skips sending once either side has closed the WebSocket.
+        """
+        if (websocket.client_state != WebSocketState.CONNECTED
+                or websocket.application_state != WebSocketState.CONNECTED):
+            return
+        try:
+            await send(message)
+        except Exception as e:
+            print(f"Error sending audio batch: {e.__class__.__name__} ({e})")
 
     # Configure WebSocket transport with audio processing capabilities
     transport = FastAPIWebsocketTransport(websocket, FastAPIWebsocketParams(
-        serializer=Base64AudioSerializer(),
+        serializer=Base64AudioSerializer(
+            Base64AudioSerializer.InputParams(batch_size=AUDIO_BATCH_SIZE, binary=BINARY_AUDIO),
+            send_callback=send_audio_batch
+        ),
         audio_in_enabled=True,
         audio_out_enabled=True,
         add_wav_header=False,
@@ -170,11 +228,6 @@ async def setup(websocket: WebSocket):
         transcription_enabled=True
     ))
 
-    # Configure AWS Nova Sonic parameters
-    params = Params()
-    params.input_sample_rate = SAMPLE_RATE
-    params.output_sample_rate = SAMPLE_RATE
-
     # Initialize LLM service
     llm = AWSNovaSonicLLMService(
         secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
@@ -182,17 +235,16 @@ async def setup(websocket: WebSocket):
         session_token=os.getenv("AWS_SESSION_TOKEN"),
         region='us-east-1',
         voice_id="tiffany",  # Available voices: matthew, tiffany, amy
-        params=params
+        params=_BASE_PARAMS
     )
 
     # Register function for function calls
     llm.register_function("get_balance", get_balance_from_api)
 
-    # Set up conversation context
+    # Set up conversation context; the context appends to its messages, so each
+    # connection gets its own list
     context = OpenAILLMContext(
-        messages=[
-            {"role": "system", "content": f"{system_instruction}"},
-        ],
+        messages=[_SYSTEM_MSG.copy()],
         tools=tools,
     )
     context_aggregator = llm.create_context_aggregator(context)
@@ -272,7 +324,10 @@ server = uvicorn.Server(uvicorn.Config(
     app=app,
     host='0.0.0.0',
     port=8000,
-    log_level="error"
+    log_level="error",
+    loop="uvloop" if uvloop else "asyncio",
+    # PCM audio barely compresses, so permessage-deflate would only cost CPU
+    ws_per_message_deflate=False
 ))
 
 async def serve():
@@ -280,4 +335,6 @@ async def serve():
     await server.serve()
 
 # Run the server
+if uvloop:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 asyncio.run(serve())
@@ -0,0 +1,52 @@
+# /*********************************************************************************************************************
+# *  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           *
+# *                                                                                                                    *
+# *  Licensed under the Amazon Software License (the "License"). You may not use this file except in compliance        *
+# *  with the License. A copy of the License is located at                                                             *
+# *                                                                                                                    *
+# *      http://aws.amazon.com/asl/                                                                                    *
+# *                                                                                                                    *
+# *  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES *
+# *  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    *
+# *  and limitations under the License.                                                                                *
+# **********************************************************************************************************************/
+
+"""
+Streaming Audio Resamplers
+
+This module provides the real-time resampler used by the Base64AudioSerializer.
+
+Pipecat's SOXRStreamAudioResampler runs soxr at very high quality (VHQ), which is
+far more than 16-bit speech needs and dominates per-frame CPU whenever the client
+and pipeline sample rates differ. The resampler here only changes the quality
+preset and leaves the stream handling to Pipecat.
+"""
+
+import time
+
+import soxr
+
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+
+class SoxrStreamResampler(SOXRStreamAudioResampler):
+    """Pipecat's soxr stream resampler with a configurable quality preset."""
+
+    def __init__(self, quality: str = "QQ", **kwargs):
+        """Initialize the resampler.
+
+        Args:
+            quality: soxr quality preset ("QQ", "LQ", "MQ", "HQ" or "VHQ")
+            **kwargs: Additional arguments to pass to SOXRStreamAudioResampler
+        """
+        super().__init__(**kwargs)
+        self._quality = quality
+
+    def _initialize(self, in_rate: float, out_rate: float):
+        # Same as the base class, bar the quality preset. Not delegated, as that
+        # would first build a VHQ stream only to replace it.
+        self._in_rate = in_rate
+        self._out_rate = out_rate
+        self._last_resample_time = time.time()
+        self._soxr_stream = soxr.ResampleStream(
+            in_rate=in_rate, out_rate=out_rate, num_channels=1, quality=self._quality, dtype="int16"
+        )
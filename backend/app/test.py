@@ -23,18 +23,37 @@ It handles real-time audio streaming between the client and server, including:
 
 Usage:
     python test.py
+    BINARY_AUDIO=true python test.py   # When the server runs with BINARY_AUDIO=true
 
 The client will connect to the configured WebSocket server and begin streaming
 audio from the microphone while playing back responses from the server.
 """
 
 import asyncio
+import collections
+import os
+import threading
 import websockets
 import pyaudio
 import json
 import base64
 
+# orjson parses server messages considerably faster than the stdlib json module
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 SAMPLE_RATE = 16000
+BINARY_AUDIO = os.getenv("BINARY_AUDIO", "false").lower() == "true"
+
+# Message tags used when the server runs with BINARY_AUDIO=true
+BINARY_STOP = b'\x00'
+BINARY_MEDIA = b'\x01'
+
+# Max audio chunks queued for playback. The server streams faster than real time,
+# so this has to hold several seconds of speech; beyond it the oldest is dropped.
+PLAYBACK_QUEUE_CHUNKS = 256
 
 class AudioClient:
     """Audio client for testing the Virtual Banking Assistant WebSocket server.
@@ -44,18 +63,22 @@ class AudioClient:
     """
 
     def __init__(self, 
-        websocket_url="ws://localhost:8000/ws"
+        websocket_url="ws://localhost:8000/ws",
+        binary=False
     ):
         """Initialize the audio client.
         
         Args:
             websocket_url: WebSocket server URL to connect to
+            binary: Exchange tagged raw PCM binary messages instead of JSON + base64,
+                must match the server's BINARY_AUDIO setting
         """
         self.websocket_url = websocket_url
+        self.binary = binary
         self.audio = pyaudio.PyAudio()
         
         # Audio parameters matching the server's expectations
-        self.CHUNK = 480  # 30ms at 16kHz
+        self.CHUNK = 960  # 60ms at 16kHz
         self.FORMAT = pyaudio.paInt16
         self.CHANNELS = 1
         self.RATE = SAMPLE_RATE
@@ -68,6 +91,9 @@ class AudioClient:
             input=True,
             frames_per_buffer=self.CHUNK
         )
+        # Microphone read loop state, see send_audio
+        self.is_recording = True
+        self.pending_read = None
 
         # Initialize audio output stream
         CHUNK = 1024
@@ -82,22 +108,41 @@ class AudioClient:
             output=True
         )
 
+        # Playback queue drained by a dedicated thread, so blocking writes to
+        # the output stream never stall the event loop
+        self.audio_queue = collections.deque(maxlen=PLAYBACK_QUEUE_CHUNKS)
+        self.audio_ready = threading.Event()
+        self.is_playing = True
+        self.playback_thread = threading.Thread(target=self.play_audio, daemon=True)
+        self.playback_thread.start()
+
+    def play_audio(self):
+        """Playback thread loop writing queued audio to the output stream."""
+        while self.is_playing:
+            try:
+                audio_data = self.audio_queue.popleft()
+            except IndexError:
+                self.audio_ready.wait(0.05)
+                self.audio_ready.clear()
+                continue
+            self.out_stream.write(audio_data)
+
+    def queue_audio(self, audio_data):
+        """Queue audio data for playback.
+
+        Args:
+            audio_data: Raw PCM audio to play
+        """
+        self.audio_queue.append(audio_data)
+        self.audio_ready.set()
+
     def clear_buffer(self):
-        """Clear the audio buffer and stop current playback.
+        """Clear the audio buffer on interruption.
         
-        This helps manage audio playback and prevent buffer overflow
-        by clearing queued audio data and resetting the output stream.
+        Drops all queued audio so playback stops after the chunk currently
+        being written, without restarting the output stream.
         """
-        # Clear the queue
-        while not self.audio_buffer.empty():
-            self.audio_buffer.get()
-            
-        # Stop current playback
-        self.is_playing = False
-        
-        # Flush the output stream
-        self.out_stream.stop_stream()
-        self.out_stream.start_stream()
+        self.audio_queue.clear()
         
     async def process_server_messages(self, websocket):
         """Handle messages received from the server.
@@ -107,21 +152,38 @@ class AudioClient:
 
         Processes different types of server messages:
         - 'media': Audio data to play back
+        - 'batch': Several 'media' messages coalesced into one
         - 'stop': Interruption signal to clear audio buffer
+
+        In binary mode the first byte of each message is the tag (BINARY_MEDIA
+        or BINARY_STOP) and any remaining bytes are raw PCM.
         """
         try:
             while True:
                 message = await websocket.recv()
-                message = json.loads(message)
+
+                if self.binary:
+                    if message[:1] == BINARY_MEDIA:
+                        self.queue_audio(message[1:])
+                    elif message[:1] == BINARY_STOP:
+                        print('Interruption')
+                        self.clear_buffer()
+                    continue
+
+                message = json_loads(message)
 
                 if message['event'] == 'media':
                     # Decode and play audio data
                     audio_data = base64.b64decode(message['data'])
-                    self.out_stream.write(audio_data)
+                    self.queue_audio(audio_data)
+
+                elif message['event'] == 'batch':
+                    for item in message['items']:
+                        self.queue_audio(base64.b64decode(item['data']))
 
                 elif message['event'] == 'stop':
                     print('Interruption')
-                    clear_buffer()
+                    self.clear_buffer()
 
         except websockets.exceptions.ConnectionClosed:
             print("Connection to server closed")
@@ -135,16 +197,23 @@ class AudioClient:
             websocket: The WebSocket connection to send audio through
 
         Continuously reads from the microphone and sends base64-encoded
-        audio data to the server.
+        (or, in binary mode, tagged raw) audio data to the server. The blocking
+        microphone read paces the loop and runs in an executor so the event
+        loop stays free to handle server messages. The read is shielded from
+        cancellation, so run() can wait for it before closing the stream.
         """
+        loop = asyncio.get_running_loop()
         try:
-            while True:
+            while self.is_recording:
                 # Read audio chunk from microphone
-                data = self.stream.read(self.CHUNK, exception_on_overflow=False)
-                # Encode audio data to base64
-                encoded_data = base64.b64encode(data).decode('utf-8')
-                await websocket.send(encoded_data)
-                await asyncio.sleep(0.01)  # Small delay to prevent overwhelming the server
+                self.pending_read = loop.run_in_executor(None, self.stream.read, self.CHUNK, False)
+                data = await asyncio.shield(self.pending_read)
+                if self.binary:
+                    await websocket.send(BINARY_MEDIA + data)
+                else:
+                    # Encode audio data to base64
+                    encoded_data = base64.b64encode(data).decode('utf-8')
+                    await websocket.send(encoded_data)
         except Exception as e:
             print(f"Error sending audio: {e}")
 
@@ -155,7 +224,8 @@ class AudioClient:
         audio communication with the server.
         """
         try:
-            async with websockets.connect(self.websocket_url) as websocket:
+            # Audio does not compress well, skip permessage-deflate
+            async with websockets.connect(self.websocket_url, compression=None) as websocket:
                 print("Connected to server")
                 await asyncio.gather(
                     self.send_audio(websocket),
@@ -164,9 +234,19 @@ class AudioClient:
         except Exception as e:
             print(f"Connection error: {e}")
         finally:
-            # Clean up audio resources
+            # Stop the microphone loop and let an in-flight read finish, it would
+            # otherwise still be using the input stream when it is closed below
+            self.is_recording = False
+            if self.pending_read is not None:
+                await asyncio.wait([self.pending_read])
+            # Stop playback and clean up audio resources
+            self.is_playing = False
+            self.audio_ready.set()
+            self.playback_thread.join()
             self.stream.stop_stream()
             self.stream.close()
+            self.out_stream.stop_stream()
+            self.out_stream.close()
             self.audio.terminate()
 
     def start(self):
@@ -180,7 +260,7 @@ class AudioClient:
         asyncio.run(self.run())
 
 if __name__ == "__main__":
-    client = AudioClient()
+    client = AudioClient(binary=BINARY_AUDIO)
     try:
         client.start()
     except KeyboardInterrupt:
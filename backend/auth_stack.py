@@ -0,0 +1,165 @@
+# /*********************************************************************************************************************
+# *  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           *
+# *                                                                                                                    *
+# *  Licensed under the Amazon Software License (the "License"). You may not use this file except in compliance        *
+# *  with the License. A copy of the License is located at                                                             *
+# *                                                                                                                    *
+# *      http://aws.amazon.com/asl/                                                                                    *
+# *                                                                                                                    *
+# *  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES *
+# *  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    *
+# *  and limitations under the License.                                                                                *
+# **********************************************************************************************************************/
+
+"""
+AWS CDK Auth Stack for Virtual Banking Assistant
+
+This module defines the authentication resources for the Virtual Banking Assistant:
+- Cognito User Pool and User Pool Client for sign-in
+- Cognito Identity Pool and the IAM role assumed by authenticated users
+
+Nothing in CdkStack references these resources, so the two stacks have no
+cross-stack dependency. Keeping the IAM/Cognito resources, and their slow
+eventual-consistency waits, in their own stack lets `cdk deploy --all
+--concurrency 2` deploy it in parallel with the compute and hosting stack.
+"""
+
+from aws_cdk import (
+    Stack,
+    CfnOutput,
+    aws_iam as iam,
+    aws_cognito as cognito,
+    RemovalPolicy
+)
+from constructs import Construct
+import cdk_nag
+
+# Immutable user pool settings. These are plain JSII structs, not constructs, so one
+# instance can be shared by every user pool built in this process.
+_PASSWORD_POLICY = cognito.PasswordPolicy(
+    min_length=8,
+    require_digits=True,
+    require_lowercase=True,
+    require_symbols=True,
+    require_uppercase=True
+)
+_STANDARD_ATTRIBUTES = cognito.StandardAttributes(
+    email=cognito.StandardAttribute(
+        required=True,
+        mutable=False
+    )
+)
+_AUTO_VERIFY = cognito.AutoVerifiedAttrs(
+    email=True
+)
+
+# cdk-nag suppressions as (resource key, rule id, reason), see the resource map in AuthStack
+SUPPRESSIONS = (
+    ('user_pool', 'AwsSolutions-COG3',
+        'Advaced security model wont be used for sample code.'),
+)
+
+class AuthStack(Stack):
+    """CDK Stack for Virtual Banking Assistant authentication.
+    
+    This stack creates the Cognito user pool, identity pool and the IAM role
+    used by signed-in users of the frontend.
+    """
+
+    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+        """Initialize the auth stack.
+        
+        Args:
+            scope: The scope in which to define this construct
+            construct_id: The scoped construct ID
+            **kwargs: Additional arguments to pass to Stack
+        """
+        super().__init__(scope, construct_id, **kwargs)
+
+        # Create Cognito User Pool
+        user_pool = cognito.UserPool(self, "VirtualBankingAssistantUserpool",
+            removal_policy=RemovalPolicy.DESTROY,
+            self_sign_up_enabled=False,
+            enable_sms_role=False,
+            mfa=cognito.Mfa.OFF,
+            account_recovery=cognito.AccountRecovery.EMAIL_ONLY,
+            password_policy=_PASSWORD_POLICY,
+            standard_attributes=_STANDARD_ATTRIBUTES,
+            auto_verify=_AUTO_VERIFY
+        )
+
+        # Add Cognito User Pool Client
+        user_pool_client = user_pool.add_client("VirtualBankingAssistantUserpoolClient",
+            auth_flows=cognito.AuthFlow(
+                admin_user_password=False,
+                custom=False,
+                user_password=False,
+                user_srp=True
+            ),
+            disable_o_auth=True,
+            prevent_user_existence_errors=True,
+            supported_identity_providers=[]
+        )
+
+        # Resolve each token once (every JSII property read is a kernel round trip).
+        # These reads only return unresolved tokens, so wrapping them in cdk.Lazy would
+        # not defer any work, it would add a JS to Python callback per value on synth.
+        user_pool_id = user_pool.user_pool_id
+        user_pool_provider_name = user_pool.user_pool_provider_name
+        user_pool_client_id = user_pool_client.user_pool_client_id
+
+        # Create Cognito Identity Pool
+        identity_pool = cognito.CfnIdentityPool(self, "VirtualBankingAssistantIdentityPool",
+            allow_unauthenticated_identities=False,
+            allow_classic_flow=False,
+            cognito_identity_providers=[cognito.CfnIdentityPool.CognitoIdentityProviderProperty(
+                client_id=user_pool_client_id,
+                provider_name=user_pool_provider_name
+            )]
+        )
+        identity_pool_id = identity_pool.ref
+
+        # Create IAM role for authenticated users
+        authenticated_role = iam.Role(self, "VirtualBankingAssistantAuthenticatedRole",
+            assumed_by=iam.FederatedPrincipal(
+                'cognito-identity.amazonaws.com',
+                {
+                    "StringEquals": {
+                        "cognito-identity.amazonaws.com:aud": identity_pool_id
+                    },
+                    "ForAnyValue:StringLike": {
+                        "cognito-identity.amazonaws.com:amr": "authenticated"
+                    }
+                },
+                'sts:AssumeRoleWithWebIdentity'
+            )
+        )
+
+        # Attach roles to identity pool
+        cognito.CfnIdentityPoolRoleAttachment(self, "VirtualBankingAssistantRoleAttachment",
+            identity_pool_id=identity_pool_id,
+            roles={
+                'authenticated': authenticated_role.role_arn
+            }
+        )
+
+        # Output important resource information
+        outputs = (
+            ("UserPoolId", user_pool_id),
+            ("UserPoolClientId", user_pool_client_id),
+            ("IdentityPoolId", identity_pool_id),
+        )
+        for output_id, value in outputs:
+            CfnOutput(self, output_id, value=value)
+
+        # cdk-nag suppressions, attached directly to the underlying Cfn resources
+        # so no construct path has to be resolved. Skipped unless the checks run.
+        if self.node.try_get_context('enable-nag') not in (True, 'true'):
+            return
+        suppressed_resources = {
+            'user_pool': user_pool.node.default_child,
+        }
+        for key, rule_id, reason in SUPPRESSIONS:
+            cdk_nag.NagSuppressions.add_resource_suppressions(suppressed_resources[key],
+                [{'id': rule_id, 'reason': reason}]
+            )
\ No newline at end of file
@@ -16,17 +16,25 @@
 AWS CDK Application Entry Point
 
 This module serves as the entry point for the AWS CDK application. It initializes and
-configures the CDK stack for deployment. The stack can be environment-agnostic or
+configures the CDK stacks for deployment. The stacks can be environment-agnostic or
 configured for specific AWS accounts and regions.
 
+The app contains two independent stacks, the main CdkStack and the Cognito AuthStack,
+which can be deployed in parallel.
+
 The application uses environment variables CDK_DEFAULT_ACCOUNT and CDK_DEFAULT_REGION
 to determine the deployment target, making it flexible for different deployment
 environments.
 
 Usage:
-    cdk deploy       # Deploy the stack to AWS
-    cdk synth       # Synthesize CloudFormation template
-    cdk destroy     # Remove the stack from AWS
+    cdk deploy --all --concurrency 2   # Deploy both stacks to AWS in parallel
+    cdk synth       # Synthesize CloudFormation templates
+    cdk synth -c enable-nag=true   # Synthesize with the cdk-nag AwsSolutions checks (CI)
+    cdk destroy --all   # Remove the stacks from AWS
+
+Context:
+    enable-nag: Run the cdk-nag AwsSolutions checks. Off by default so local synths
+        skip the checks and the suppressions, set it in CI.
 
 Environment Variables:
     CDK_DEFAULT_ACCOUNT: AWS account ID for deployment
@@ -39,26 +47,35 @@ import aws_cdk as cdk
 from cdk_nag import AwsSolutionsChecks
 
 from cdk_stack import CdkStack
+from auth_stack import AuthStack
 
 # Initialize the CDK application
 app = cdk.App()
 
-# Add the cdk-nag AwsSolutions Pack with extra verbose logging enabled
-cdk.Aspects.of(app).add(AwsSolutionsChecks(verbose=True))
+# Add the cdk-nag AwsSolutions Pack with extra verbose logging enabled, only when
+# requested with `-c enable-nag=true` as the checks visit every construct on synth
+if app.node.try_get_context('enable-nag') in (True, 'true'):
+    cdk.Aspects.of(app).add(AwsSolutionsChecks(verbose=True))
+
+# For environment-specific deployment, use the current CLI configuration
+# If you don't specify 'env', the stacks will be environment-agnostic.
+# Account/Region-dependent features and context lookups will not work,
+# but a single synthesized template can be deployed anywhere.
+env = cdk.Environment(
+    account=os.getenv('CDK_DEFAULT_ACCOUNT'), 
+    region=os.getenv('CDK_DEFAULT_REGION')
+)
+
+# Create the Virtual Banking Assistant auth stack (Cognito and IAM)
+AuthStack(app, "VirtualBankingAssistantAuthStack",
+    env=env,
+    description='Virtual Banking Assistant Auth (uksb-ybsvnefrsb)'
+)
 
 # Create the Virtual Banking Assistant stack
 # The stack can be environment-agnostic (deploy anywhere) or environment-specific
 CdkStack(app, "VirtualBankingAssistantCdkStack",
-    # If you don't specify 'env', this stack will be environment-agnostic.
-    # Account/Region-dependent features and context lookups will not work,
-    # but a single synthesized template can be deployed anywhere.
-
-    # For environment-specific deployment, use the current CLI configuration
-    env=cdk.Environment(
-        account=os.getenv('CDK_DEFAULT_ACCOUNT'), 
-        region=os.getenv('CDK_DEFAULT_REGION')
-    ),
-
+    env=env,
     description='Virtual Banking Assistant (uksb-ybsvnefrsb)'
 
     # For explicit account/region deployment, uncomment and modify:
@@ -68,9 +85,5 @@ CdkStack(app, "VirtualBankingAssistantCdkStack",
     # https://docs.aws.amazon.com/cdk/latest/guide/environments.html
 )
 
-# Optional: Add AWS Solutions security checks
-# Uncomment to enable detailed security analysis during synthesis
-# cdk.Aspects.of(app).add(AwsSolutionsChecks(verbose=True))
-
 # Synthesize the CloudFormation template
 app.synth()
@@ -182,6 +182,32 @@ function Content({ signOut, user }) {
                 await initMicrophone();
             };
 
+            // Decode a base64 PCM chunk and queue it for playback
+            const playMedia = (base64Data) => {
+                try {
+                    const binaryString = atob(base64Data);
+                    const bytes = new Uint8Array(binaryString.length);
+                    for (let i = 0; i < binaryString.length; i++) {
+                        bytes[i] = binaryString.charCodeAt(i);
+                    }
+
+                    const float32Array = pcm16ToFloat(bytes.buffer);
+
+                    if (float32Array.length > 0) {
+                        audioWorkletNodeRef.current?.port.postMessage({
+                            type: 'data',
+                            audio: float32Array
+                        });
+
+                        if (!isTalking) {
+                            setTalking(true);
+                        }
+                    }
+                } catch (error) {
+                    console.error('Error processing audio data:', error);
+                }
+            };
+
             wsRef.current.onmessage = async (event) => {
                 const chunk = JSON.parse(event.data);
 
@@ -194,29 +220,9 @@ function Content({ signOut, user }) {
                     setTalking(false);
 
                 } else if (chunk.event === 'media') {
-                    try {
-                        const base64Data = chunk.data;
-                        const binaryString = atob(base64Data);
-                        const bytes = new Uint8Array(binaryString.length);
-                        for (let i = 0; i < binaryString.length; i++) {
-                            bytes[i] = binaryString.charCodeAt(i);
-                        }
-
-                        const float32Array = pcm16ToFloat(bytes.buffer);
-
-                        if (float32Array.length > 0) {
-                            audioWorkletNodeRef.current?.port.postMessage({
-                                type: 'data',
-                                audio: float32Array
-                            });
-
-                            if (!isTalking) {
-                                setTalking(true);
-                            }
-                        }
-                    } catch (error) {
-                        console.error('Error processing audio data:', error);
-                    }
+                    playMedia(chunk.data);
+                } else if (chunk.event === 'batch') {
+                    chunk.items.forEach(item => playMedia(item.data));
                 } else if (chunk.event === 'text') {
                     setMessages(messages => [...messages, {
                         isMine: chunk.speaker === 'user',